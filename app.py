@@ -6,6 +6,7 @@ Interactive web interface for testing and visualizing the cost-aware LLM routing
 
 import streamlit as st
 import sys
+from collections import deque
 from pathlib import Path
 import os
 import time
@@ -14,10 +15,11 @@ import time
 sys.path.insert(0, str(Path(__file__).parent))
 
 from routing.router import LLMRouter
+from routing.cache import SemanticCache
 from routing.difficulty import QueryDifficultyEstimator
-from llm.local import LocalLLM
+from llm.local_pool import LocalLLMPool
 from llm.openai_llm import OpenAILLM
-from utils.metrics import MetricsLogger
+from utils.metrics import AsyncMetricsLogger
 
 
 # Page configuration
@@ -73,12 +75,18 @@ def initialize_router():
         # Initialize difficulty estimator
         difficulty_estimator = QueryDifficultyEstimator()
         
-        # Load local LLM
-        model_path = Path(__file__).parent / "models" / "phi-2.Q4_K_M.gguf"
+        # Load local LLM. The GGUF path is overridable via LOCAL_GGUF so
+        # lower-bit quants (Q3_K_S, IQ3_XXS) can be swapped in: local
+        # inference is memory-bandwidth-bound, so fewer weight bytes per
+        # token translates almost directly into higher throughput.
+        default_model = Path(__file__).parent / "models" / "phi-2.Q4_K_M.gguf"
+        model_path = Path(os.getenv("LOCAL_GGUF", str(default_model)))
         if not model_path.exists():
-            return None, None, "Model not found. Please download phi-2.Q4_K_M.gguf to the models/ directory."
+            return None, None, f"Model not found at {model_path}. Download a phi-2 GGUF to models/ or set LOCAL_GGUF."
         
-        local_llm = LocalLLM(str(model_path))
+        # Pool the local model so concurrent reruns don't hang behind
+        # llama-cpp-python's single inference lock
+        local_llm = LocalLLMPool(str(model_path), n_workers=1)
         
         # Initialize remote LLM (if API key is available)
         api_key = os.getenv("OPENAI_API_KEY")
@@ -95,12 +103,31 @@ def initialize_router():
             local_llm=local_llm,
             remote_llm=remote_llm
         )
-        
+
+        # Enable the semantic cache tier when embeddings are available, so
+        # paraphrased repeats hit the cache too. Built inside this
+        # cache_resource initializer, so the embedder is warm after startup.
+        if router.verifier._embedding_client is not None:
+            router.cache = SemanticCache(embed_fn=router.verifier._embed)
+
         return router, difficulty_estimator, None
     except Exception as e:
         return None, None, str(e)
 
 
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def _cached_route(query: str) -> dict:
+    """
+    Route a query through the (resource-cached) router, memoized per query.
+
+    Repeat submissions of the same query within the TTL — e.g., re-runs when
+    the user toggles display settings — return the stored result in <1 ms
+    without invoking any model. max_entries bounds cache memory growth.
+    """
+    router, _, _ = initialize_router()
+    return router.route(query)
+
+
 def format_difficulty_score(score: float) -> tuple:
     """Format difficulty score with color and emoji."""
     if score < 0.3:
@@ -162,6 +189,10 @@ def main():
         st.subheader("Settings")
         show_details = st.checkbox("Show Detailed Analysis", value=True)
         show_response = st.checkbox("Show Full Response", value=True)
+        stream_mode = st.checkbox(
+            "Stream Response", value=False,
+            help="Show tokens as they are generated (skips verification and cost analysis)."
+        )
         
         st.divider()
         
@@ -204,24 +235,51 @@ def main():
             st.session_state.total_queries = 0
             st.session_state.total_cost = 0.0
             st.session_state.total_saved = 0.0
-        
+            # Bounded history: Streamlit never reaps closed-tab sessions, so
+            # unbounded per-query state grows monotonically in long-running
+            # deployments. A maxlen deque caps per-session memory.
+            st.session_state.history = deque(maxlen=256)
+
         st.metric("Total Queries", st.session_state.total_queries)
         st.metric("Total Cost", f"${st.session_state.total_cost:.6f}")
         st.metric("Total Saved", f"${st.session_state.total_saved:.6f}")
+
+        if st.session_state.history:
+            with st.expander("🕘 Recent Queries"):
+                for entry in reversed(st.session_state.history):
+                    st.caption(
+                        f"{entry['query'][:60]} — {entry['routing_decision']} "
+                        f"(difficulty {entry['difficulty']:.3f})"
+                    )
     
+    # Process query (streaming mode: render tokens as they arrive)
+    if submit_button and query and stream_mode:
+        st.divider()
+        st.header("💬 Response")
+        try:
+            st.write_stream(router.stream_route(query))
+        except Exception as e:
+            st.error(f"❌ Error: {str(e)}")
+
     # Process query
-    if submit_button and query:
+    elif submit_button and query:
         with st.spinner("Routing query and generating response..."):
             try:
                 # Route query
                 start_time = time.time()
-                result = router.route(query)
+                result = _cached_route(query)
                 end_time = time.time()
                 
                 # Update session state
                 st.session_state.total_queries += 1
                 st.session_state.total_cost += result.get("cost_usd", 0.0)
                 st.session_state.total_saved += result.get("cost_saved_usd", 0.0)
+                # Store only a small summary per query, not the full result
+                st.session_state.history.append({
+                    "query": query,
+                    "routing_decision": result.get("routing_decision", "unknown"),
+                    "difficulty": result.get("difficulty", 0.0)
+                })
                 
                 # Display results
                 st.divider()
@@ -262,11 +320,14 @@ def main():
                     
                     # Difficulty breakdown
                     with st.expander("📈 Difficulty Breakdown", expanded=True):
-                        if difficulty_estimator:
-                            length_score = difficulty_estimator._length_score(query)
-                            keyword_score = difficulty_estimator._keyword_score(query)
-                            structure_score = difficulty_estimator._structure_score(query)
-                            
+                        # Component scores come back from router.route(), so
+                        # the estimator doesn't run a second time per query
+                        components = result.get("difficulty_components")
+                        if components:
+                            length_score = components["length"]
+                            keyword_score = components["keyword"]
+                            structure_score = components["structure"]
+
                             col1, col2, col3 = st.columns(3)
                             with col1:
                                 st.write("**Length Score**")
@@ -395,6 +456,7 @@ def main():
         st.session_state.total_queries = 0
         st.session_state.total_cost = 0.0
         st.session_state.total_saved = 0.0
+        st.session_state.history = deque(maxlen=256)
         st.rerun()
     
     # Footer
@@ -6,7 +6,8 @@ This package provides abstractions and implementations for various LLM providers
 
 from .base import BaseLLM
 from .local import LocalLLM
+from .local_pool import LocalLLMPool
 from .openai_llm import OpenAILLM
 
-__all__ = ["BaseLLM", "LocalLLM", "OpenAILLM"]
+__all__ = ["BaseLLM", "LocalLLM", "LocalLLMPool", "OpenAILLM"]
 
@@ -0,0 +1,140 @@
+"""
+Process-pooled local LLM.
+
+llama-cpp-python holds a single inference lock and is not thread-safe, so
+concurrent callers (the Streamlit event loop, async batch drivers) would
+serialize or hang behind one Llama instance. This module wraps LocalLLM in a
+process pool — one Llama per worker process — so local generations can run
+concurrently with each other and with remote API calls.
+"""
+
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict
+
+from .base import BaseLLM
+
+# Per-process model instance, created once by the pool initializer.
+# Module-level so worker functions stay picklable.
+_worker_llm = None
+
+
+def _init_worker(model_path: str):
+    """Initialize one LocalLLM instance in the worker process."""
+    global _worker_llm
+    from .local import LocalLLM
+    _worker_llm = LocalLLM(model_path)
+
+
+def _worker_generate(prompt: str, max_tokens: int) -> Dict:
+    """Run generation on the worker's model instance."""
+    return _worker_llm.generate(prompt, max_tokens=max_tokens)
+
+
+def _worker_stream(prompt: str, max_tokens: int, out_queue):
+    """
+    Stream generation on the worker's model instance into a queue.
+
+    Fragments cross the process boundary through a manager queue as they
+    are produced; a None sentinel marks the end of the stream. The
+    sentinel goes out even on failure so the consuming generator never
+    hangs — the worker's exception then surfaces through the future.
+    """
+    try:
+        for fragment in _worker_llm.stream_generate(prompt, max_tokens=max_tokens):
+            out_queue.put(fragment)
+    finally:
+        out_queue.put(None)
+
+
+class LocalLLMPool(BaseLLM):
+    """
+    Local LLM backed by a pool of worker processes.
+
+    Each worker loads its own Llama instance, so N workers can serve N
+    generations in parallel. On Metal there is typically one usable GPU slot
+    (n_workers=1 still removes the hang under concurrent callers); on CPU,
+    more workers give real parallelism at the cost of one model copy each.
+    """
+
+    def __init__(self, model_path: str, n_workers: int = 1):
+        """
+        Initialize the pool and preload the model in each worker.
+
+        Args:
+            model_path: Path to GGUF model file (e.g., "models/phi-2.Q4_K_M.gguf")
+            n_workers: Number of worker processes (each loads a full model copy)
+        """
+        self.model_path = model_path
+        self.n_workers = n_workers
+        self._executor = ProcessPoolExecutor(
+            max_workers=n_workers,
+            initializer=_init_worker,
+            initargs=(model_path,)
+        )
+        # Manager process for streaming queues, started on first use —
+        # blocking-only callers shouldn't pay for an extra process
+        self._manager = None
+
+    def generate(self, prompt: str, max_tokens: int = 256) -> Dict:
+        """
+        Generate text completion from a prompt (blocking).
+
+        Args:
+            prompt: Input text prompt
+            max_tokens: Maximum number of tokens to generate
+
+        Returns:
+            Dictionary with text, token counts, latency metrics, model, and device
+        """
+        future = self._executor.submit(_worker_generate, prompt, max_tokens)
+        return future.result()
+
+    async def agenerate(self, prompt: str, max_tokens: int = 256) -> Dict:
+        """
+        Generate text completion without blocking the event loop.
+
+        Args:
+            prompt: Input text prompt
+            max_tokens: Maximum number of tokens to generate
+
+        Returns:
+            Dictionary with text, token counts, latency metrics, model, and device
+        """
+        future = self._executor.submit(_worker_generate, prompt, max_tokens)
+        return await asyncio.wrap_future(future)
+
+    def stream_generate(self, prompt: str, max_tokens: int = 256):
+        """
+        Generate a completion as a stream of text deltas.
+
+        The worker process runs LocalLLM.stream_generate and feeds each
+        fragment through a manager queue, so callers (st.write_stream,
+        stream_route) see tokens at time-to-first-token latency even
+        though generation lives in another process.
+
+        Args:
+            prompt: Input text prompt
+            max_tokens: Maximum number of tokens to generate
+
+        Yields:
+            Text fragments as they are generated
+        """
+        if self._manager is None:
+            self._manager = multiprocessing.Manager()
+        out_queue = self._manager.Queue()
+        future = self._executor.submit(_worker_stream, prompt, max_tokens, out_queue)
+        while True:
+            fragment = out_queue.get()
+            if fragment is None:
+                break
+            yield fragment
+        future.result()  # Surface worker-side exceptions to the caller
+
+    def shutdown(self):
+        """Shut down the worker processes."""
+        self._executor.shutdown(wait=False)
+        if self._manager is not None:
+            self._manager.shutdown()
+            self._manager = None
@@ -4,12 +4,56 @@ Remote LLM implementation using OpenAI GPT-4o.
 Provides real API-backed inference with cost and latency tracking.
 """
 
+import asyncio
+import os
+import random
 import time
+import weakref
 from typing import Dict
-from openai import OpenAI
+import httpx
+from openai import OpenAI, AsyncOpenAI, RateLimitError
+
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
 
 from .base import BaseLLM
 
+# Concurrency cap for async OpenAI calls: unbounded gather smashes the
+# account QPM ceiling and turns into serialized 429 retries. Semaphores are
+# created lazily, one per running event loop — a module-level Semaphore
+# binds to whichever loop first waits on it (breaking a second asyncio.run
+# batch in the same process), and on 3.9 grabs an event loop at
+# construction time, failing imports from non-main threads.
+_CONCURRENCY = int(os.getenv("OPENAI_CONCURRENCY", "16"))
+_LOOP_SEMAPHORES = weakref.WeakKeyDictionary()
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    """Return the shared concurrency semaphore for the running event loop."""
+    loop = asyncio.get_running_loop()
+    semaphore = _LOOP_SEMAPHORES.get(loop)
+    if semaphore is None:
+        semaphore = _LOOP_SEMAPHORES[loop] = asyncio.Semaphore(_CONCURRENCY)
+    return semaphore
+
+# Retry policy for rate-limited calls: exponential backoff with jitter
+_MAX_RETRIES = 6
+_MAX_BACKOFF_SECONDS = 30.0
+
+# Lazily-initialized tiktoken encoder, shared across all OpenAILLM instances
+_ENCODER = None
+
+
+def _get_encoder():
+    """Return the cached tiktoken encoder, or None if tiktoken is absent."""
+    global _ENCODER
+    if _ENCODER is None and TIKTOKEN_AVAILABLE:
+        _ENCODER = tiktoken.encoding_for_model("gpt-4o")
+    return _ENCODER
+
 
 class OpenAILLM(BaseLLM):
     """
@@ -32,7 +76,84 @@ class OpenAILLM(BaseLLM):
             model: Model name (default: "gpt-4o")
         """
         self.client = OpenAI(api_key=api_key)
+
+        # Shared async HTTP client with a pool sized for batch fan-out:
+        # the default httpx limits (20 keepalive connections) force new TLS
+        # handshakes under concurrency. HTTP/2 multiplexes requests over one
+        # connection when the h2 extra is installed.
+        limits = httpx.Limits(max_connections=256, max_keepalive_connections=64)
+        try:
+            self._http_client = httpx.AsyncClient(
+                http2=True, limits=limits, timeout=60.0
+            )
+        except ImportError:
+            # h2 not installed; HTTP/1.1 with the tuned pool still helps
+            self._http_client = httpx.AsyncClient(limits=limits, timeout=60.0)
+        self.aclient = AsyncOpenAI(api_key=api_key, http_client=self._http_client)
         self.model = model
+
+    async def aclose(self):
+        """Close the shared async HTTP client."""
+        await self._http_client.aclose()
+
+    def estimate_cost(self, prompt: str, max_tokens: int = 256) -> float:
+        """
+        Estimate the worst-case USD cost of a call before making it.
+
+        Counts input tokens locally with a cached tiktoken encoder (falling
+        back to a chars/4 approximation if tiktoken is not installed) and
+        assumes the full max_tokens output budget is used. Lets the router
+        skip or downgrade over-budget prompts without a network round-trip.
+
+        Args:
+            prompt: Input text prompt
+            max_tokens: Output token budget that would be requested
+
+        Returns:
+            Projected cost in USD
+        """
+        encoder = _get_encoder()
+        if encoder is not None:
+            input_tokens = len(encoder.encode(prompt))
+        else:
+            # Rough heuristic: ~4 characters per token for English text
+            input_tokens = len(prompt) // 4
+
+        return (
+            (input_tokens / 1000) * self.INPUT_COST_PER_1K +
+            (max_tokens / 1000) * self.OUTPUT_COST_PER_1K
+        )
+
+    def _build_result(self, response, latency_ms: float) -> Dict:
+        """
+        Build the standard result dictionary from an API response.
+
+        Args:
+            response: ChatCompletion response from the OpenAI API
+            latency_ms: Measured request latency in milliseconds
+
+        Returns:
+            Dictionary with text, token counts, latency, cost, and metadata
+        """
+        usage = response.usage
+        input_tokens = usage.prompt_tokens
+        output_tokens = usage.completion_tokens
+
+        # Calculate actual cost in USD
+        cost_usd = (
+            (input_tokens / 1000) * self.INPUT_COST_PER_1K +
+            (output_tokens / 1000) * self.OUTPUT_COST_PER_1K
+        )
+
+        return {
+            "text": response.choices[0].message.content.strip(),
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "latency_ms": latency_ms,
+            "model": self.model,
+            "device": "openai_api",
+            "cost_usd": round(cost_usd, 6)
+        }
     
     def generate(self, prompt: str, max_tokens: int = 256) -> Dict:
         """
@@ -57,24 +178,74 @@ class OpenAILLM(BaseLLM):
         )
         
         end = time.time()
-        
-        usage = response.usage
-        input_tokens = usage.prompt_tokens
-        output_tokens = usage.completion_tokens
-        
-        # Calculate actual cost in USD
-        cost_usd = (
-            (input_tokens / 1000) * self.INPUT_COST_PER_1K +
-            (output_tokens / 1000) * self.OUTPUT_COST_PER_1K
+
+        return self._build_result(response, (end - start) * 1000)
+
+    def stream_generate(self, prompt: str, max_tokens: int = 256):
+        """
+        Generate a completion as a stream of text deltas.
+
+        Yields content fragments as the API returns them, cutting perceived
+        latency to roughly one-token latency for interactive callers.
+
+        Args:
+            prompt: Input text prompt
+            max_tokens: Maximum number of tokens to generate
+
+        Yields:
+            Text fragments as they are generated
+        """
+        stream = self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=max_tokens,
+            temperature=0.0,
+            stream=True
         )
-        
-        return {
-            "text": response.choices[0].message.content.strip(),
-            "input_tokens": input_tokens,
-            "output_tokens": output_tokens,
-            "latency_ms": (end - start) * 1000,
-            "model": self.model,
-            "device": "openai_api",
-            "cost_usd": round(cost_usd, 6)
-        }
+        for chunk in stream:
+            if chunk.choices:
+                yield chunk.choices[0].delta.content or ""
+
+    async def agenerate(self, prompt: str, max_tokens: int = 256) -> Dict:
+        """
+        Generate text completion using the async OpenAI client.
+
+        Awaitable counterpart of generate(); multiple calls can be fanned out
+        with asyncio.gather so network round-trips overlap instead of serializing.
+        Concurrency is capped by a per-event-loop semaphore (OPENAI_CONCURRENCY,
+        default 16) and rate-limit errors are retried with exponential backoff
+        plus jitter, so batch fan-out degrades gracefully instead of 429-ing.
+
+        Args:
+            prompt: Input text prompt
+            max_tokens: Maximum number of tokens to generate
+
+        Returns:
+            Dictionary with text, token counts, latency, cost, and metadata
+        """
+        async with _get_semaphore():
+            start = time.time()
+
+            for attempt in range(_MAX_RETRIES):
+                try:
+                    response = await self.aclient.chat.completions.create(
+                        model=self.model,
+                        messages=[
+                            {"role": "user", "content": prompt}
+                        ],
+                        max_tokens=max_tokens,
+                        temperature=0.0  # Deterministic generation
+                    )
+                    break
+                except RateLimitError:
+                    if attempt == _MAX_RETRIES - 1:
+                        raise
+                    backoff = min(2 ** attempt + random.uniform(0, 1), _MAX_BACKOFF_SECONDS)
+                    await asyncio.sleep(backoff)
+
+            end = time.time()
+
+        return self._build_result(response, (end - start) * 1000)
 
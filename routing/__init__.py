@@ -5,9 +5,10 @@ This module contains components for query difficulty estimation,
 model selection, and routing logic.
 """
 
+from .cache import SemanticCache
 from .difficulty import QueryDifficultyEstimator
 from .router import LLMRouter
 from .verifier import ResponseVerifier, VerificationResult
 
-__all__ = ["QueryDifficultyEstimator", "LLMRouter", "ResponseVerifier", "VerificationResult"]
+__all__ = ["SemanticCache", "QueryDifficultyEstimator", "LLMRouter", "ResponseVerifier", "VerificationResult"]
 
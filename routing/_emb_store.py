@@ -0,0 +1,119 @@
+"""
+Persistent on-disk embedding cache.
+
+The in-memory embedding memo in ResponseVerifier dies with the process, so
+development reruns of the same handful of queries pay full OpenAI embedding
+latency every time. This module keeps vectors in a small sqlite database
+under ~/.cache so the first run pays the API cost and every rerun serves
+embeddings from disk. Rows are keyed by SHA-256 over (model, dimensions,
+text) and pruned by age on open.
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+_DEFAULT_PATH = Path.home() / ".cache" / "llm-router" / "embeddings.sqlite"
+
+# A week covers a development iteration loop without letting stale vectors
+# accumulate forever if the embedding model or dimensions change
+_DEFAULT_TTL_SECONDS = 7 * 24 * 3600.0
+
+
+class EmbeddingStore:
+    """
+    sqlite-backed text → embedding-bytes cache.
+
+    Vectors are stored as raw float32 bytes (np.ndarray.tobytes()); callers
+    reconstruct with np.frombuffer. All failures are swallowed into cache
+    misses — a broken cache directory must never break verification.
+    """
+
+    def __init__(self, path: Optional[str] = None,
+                 ttl_seconds: float = _DEFAULT_TTL_SECONDS):
+        """
+        Open (creating if needed) the on-disk store and prune expired rows.
+
+        Args:
+            path: Database file path (defaults to ~/.cache/llm-router/)
+            ttl_seconds: Maximum row age; older entries are deleted on open
+        """
+        self._conn = None
+        # Verification runs off-thread (verify_async, the speculative
+        # executor, Streamlit script threads), and sqlite's default
+        # check_same_thread=True turns every cross-thread execute into a
+        # swallowed error — i.e. a permanent cache miss. The connection is
+        # shared across threads instead and all access serialized here.
+        self._lock = threading.Lock()
+        try:
+            db_path = Path(path) if path else _DEFAULT_PATH
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings "
+                "(hash TEXT PRIMARY KEY, model TEXT, dim INT, vec BLOB, ts REAL)"
+            )
+            self._conn.execute(
+                "DELETE FROM embeddings WHERE ts < ?",
+                (time.time() - ttl_seconds,)
+            )
+            self._conn.commit()
+        except (OSError, sqlite3.Error):
+            self._conn = None  # Degrade to a no-op store
+
+    @staticmethod
+    def _key(text: str, model: str, dimensions: int) -> str:
+        """Row key: SHA-256 over the model, dimensions, and text."""
+        payload = f"{model}:{dimensions}:{text}".encode()
+        return hashlib.sha256(payload).hexdigest()
+
+    def get(self, text: str, model: str, dimensions: int) -> Optional[bytes]:
+        """
+        Look up cached embedding bytes for a text.
+
+        Args:
+            text: The embedded text
+            model: Embedding model name
+            dimensions: Requested embedding dimensions
+
+        Returns:
+            Raw float32 vector bytes, or None on miss
+        """
+        if self._conn is None:
+            return None
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT vec FROM embeddings WHERE hash = ?",
+                    (self._key(text, model, dimensions),)
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        return row[0] if row else None
+
+    def put(self, text: str, model: str, dimensions: int, vec: bytes):
+        """
+        Insert (or refresh) an embedding for a text.
+
+        Args:
+            text: The embedded text
+            model: Embedding model name
+            dimensions: Requested embedding dimensions
+            vec: Raw float32 vector bytes (np.ndarray.tobytes())
+        """
+        if self._conn is None:
+            return
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO embeddings (hash, model, dim, vec, ts) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (self._key(text, model, dimensions), model, dimensions,
+                     vec, time.time())
+                )
+                self._conn.commit()
+        except sqlite3.Error:
+            pass
@@ -0,0 +1,31 @@
+"""
+Compiled numeric kernels for the routing package.
+
+Batched similarity math for verification. Numba compiles the row-wise dot
+product into a parallel SIMD loop (fastmath lets the compiler contract FMAs);
+when numba is not installed callers fall back to a vectorized NumPy
+expression, so this module only exposes the kernel when it is available.
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def cosine_batch(query_vectors, answer_vectors, out):  # pragma: no cover - jitted
+        """
+        Row-wise dot products of two (n, d) matrices into out.
+
+        Vectors are unit-norm (see ResponseVerifier._assume_normalized), so
+        the dot product is the cosine similarity.
+        """
+        for i in prange(query_vectors.shape[0]):
+            acc = 0.0
+            for j in range(query_vectors.shape[1]):
+                acc += query_vectors[i, j] * answer_vectors[i, j]
+            out[i] = acc
@@ -0,0 +1,138 @@
+"""
+Semantic prompt cache for the router.
+
+UI and benchmark workloads issue many duplicate or near-duplicate queries.
+This module provides a two-tier cache: an exact tier keyed by a hash of the
+query (O(1), zero dependencies), and an optional semantic tier that matches
+paraphrased queries by embedding cosine similarity. A hit returns the cached
+routing result with zero model cost.
+"""
+
+import hashlib
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional
+
+try:
+    import numpy as np
+    EMBEDDINGS_AVAILABLE = True
+except ImportError:
+    EMBEDDINGS_AVAILABLE = False
+
+
+class SemanticCache:
+    """
+    Two-tier query → result cache.
+
+    Tier 1 (exact): blake2b hash of the normalized query, LRU-bounded.
+    Tier 2 (semantic): cosine similarity over normalized query embeddings;
+    a near-match above the threshold returns the cached result. The semantic
+    tier activates only when an embed_fn is provided and numpy is installed.
+    """
+
+    def __init__(
+        self,
+        similarity_threshold: float = 0.92,
+        max_entries: int = 256,
+        embed_fn: Optional[Callable[[str], Optional[List[float]]]] = None
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            similarity_threshold: Minimum cosine similarity for a semantic hit
+            max_entries: Maximum cached results (oldest evicted first)
+            embed_fn: Optional callable mapping text to an embedding vector
+                      (e.g., ResponseVerifier._embed); enables the semantic tier
+        """
+        self.similarity_threshold = similarity_threshold
+        self.max_entries = max_entries
+        self.embed_fn = embed_fn if EMBEDDINGS_AVAILABLE else None
+        self._exact: "OrderedDict[bytes, Dict]" = OrderedDict()
+        self._embeddings = []  # List of (normalized np.ndarray, exact key)
+
+    @staticmethod
+    def _key(query: str) -> bytes:
+        """Hash key for the exact tier (whitespace/case-normalized)."""
+        normalized = " ".join(query.lower().split())
+        return hashlib.blake2b(normalized.encode(), digest_size=16).digest()
+
+    def _embed_normalized(self, query: str):
+        """Embed and L2-normalize the query, or None if unavailable."""
+        if self.embed_fn is None:
+            return None
+        embedding = self.embed_fn(query)
+        if embedding is None:
+            return None
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        if norm == 0:
+            return None
+        return vector / norm
+
+    def get(self, query: str) -> Optional[Dict]:
+        """
+        Look up a cached result for the query.
+
+        Args:
+            query: The input query string
+
+        Returns:
+            Cached result dictionary, or None on miss
+        """
+        result, _ = self.get_with_tier(query)
+        return result
+
+    def get_with_tier(self, query: str):
+        """
+        Look up a cached result and report which tier matched.
+
+        Args:
+            query: The input query string
+
+        Returns:
+            Tuple of (result, tier) where tier is "exact", "semantic", or
+            None on miss. Lets metrics distinguish duplicate hits from
+            paraphrase hits.
+        """
+        key = self._key(query)
+        if key in self._exact:
+            self._exact.move_to_end(key)
+            return self._exact[key], "exact"
+
+        # Semantic tier: nearest neighbor by cosine over normalized vectors
+        if self._embeddings:
+            vector = self._embed_normalized(query)
+            if vector is not None:
+                matrix = np.stack([v for v, _ in self._embeddings])
+                similarities = matrix @ vector
+                best = int(np.argmax(similarities))
+                if similarities[best] >= self.similarity_threshold:
+                    _, best_key = self._embeddings[best]
+                    cached = self._exact.get(best_key)
+                    if cached is not None:
+                        return cached, "semantic"
+
+        return None, None
+
+    def put(self, query: str, result: Dict):
+        """
+        Insert a routing result for the query.
+
+        Args:
+            query: The input query string
+            result: Result dictionary from router.route()
+        """
+        key = self._key(query)
+        self._exact[key] = result
+        self._exact.move_to_end(key)
+
+        vector = self._embed_normalized(query)
+        if vector is not None:
+            self._embeddings.append((vector, key))
+
+        # Evict oldest entries (and their embeddings) beyond the bound
+        while len(self._exact) > self.max_entries:
+            evicted_key, _ = self._exact.popitem(last=False)
+            self._embeddings = [
+                (v, k) for v, k in self._embeddings if k != evicted_key
+            ]
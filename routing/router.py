@@ -5,12 +5,49 @@ This module implements the core routing logic that selects which model to call
 based on query difficulty, with escalation and cost optimization.
 """
 
-from typing import Dict, Optional
+import asyncio
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 from llm.base import BaseLLM
+from .cache import SemanticCache
 from .difficulty import QueryDifficultyEstimator
 from .verifier import ResponseVerifier
 
 
+# Result-dict keys assigned on every routed request, interned once at
+# import so the hot-path STORE_SUBSCRs reuse a single hashed string object
+_K_DIFFICULTY = sys.intern("difficulty")
+_K_COMPONENTS = sys.intern("difficulty_components")
+_K_DECISION = sys.intern("routing_decision")
+_K_COST_USD = sys.intern("cost_usd")
+_K_COST_SAVED_USD = sys.intern("cost_saved_usd")
+_K_COST_SAVED = sys.intern("cost_saved")
+_K_VERIFICATION = sys.intern("verification")
+
+# GPT-4o pricing folded into per-token constants: the cost estimate becomes
+# two multiplies and one add, with no per-call division
+_IN_COST_PER_TOKEN = 0.005 / 1000.0
+_OUT_COST_PER_TOKEN = 0.015 / 1000.0
+
+
+def _remote_cost(result: Dict) -> float:
+    """Estimate what this result would have cost from the remote model."""
+    return (
+        result["input_tokens"] * _IN_COST_PER_TOKEN
+        + result["output_tokens"] * _OUT_COST_PER_TOKEN
+    )
+
+
+def _build_continuation_prompt(original_query: str, partial_answer: str) -> str:
+    """Build a prompt to continue a truncated answer."""
+    return (
+        f"Question:\n{original_query}\n\n"
+        f"Partial answer:\n{partial_answer}\n\n"
+        "Continue the answer. Finish the current sentence and conclude clearly in 2–3 sentences."
+    )
+
+
 class LLMRouter:
     """
     Routes queries to appropriate LLM models based on difficulty estimation.
@@ -25,21 +62,48 @@ class LLMRouter:
         self,
         difficulty_estimator: QueryDifficultyEstimator,
         local_llm: BaseLLM,
-        remote_llm: Optional[BaseLLM] = None
+        remote_llm: Optional[BaseLLM] = None,
+        cache: Optional[SemanticCache] = None,
+        max_remote_cost_usd: Optional[float] = None,
+        speculative_remote: bool = False,
+        cache_results: bool = True
     ):
         """
         Initialize the LLM router.
-        
+
         Args:
             difficulty_estimator: QueryDifficultyEstimator instance
             local_llm: Local LLM instance (e.g., LocalLLM with GGUF model)
             remote_llm: Remote/API LLM instance (optional, for escalation)
+            cache: SemanticCache instance (defaults to an exact-match cache;
+                   pass a cache with an embed_fn to enable paraphrase hits)
+            max_remote_cost_usd: Per-call remote budget; hard queries whose
+                   projected cost exceeds it fall back to the local model
+                   (None disables the check)
+            speculative_remote: Start the remote call in a background thread
+                   for upper-medium queries (difficulty > 0.5) while the
+                   local model generates, hiding API latency when escalation
+                   is likely. Off by default: the API call is initiated (and
+                   billed) even when the local answer ends up passing
+            cache_results: Whether route() may serve memoized results for
+                   repeated queries. Sound because generation is
+                   deterministic (temperature=0); disable when sampling
+                   or fresh responses are required
         """
         self.difficulty_estimator = difficulty_estimator
         self.local_llm = local_llm
         self.remote_llm = remote_llm
         self.verifier = ResponseVerifier()
+        self.cache = cache if cache is not None else SemanticCache()
+        self.max_remote_cost_usd = max_remote_cost_usd
+        self.speculative_remote = speculative_remote
+        self.cache_results = cache_results
         self.max_retries = 1  # Allow one regeneration attempt before escalating
+        self.max_concurrency = 8  # Concurrent requests allowed in aroute_many
+        self.max_regen_tokens = 1024  # Absolute ceiling for regeneration budgets
+        self._executor = (
+            ThreadPoolExecutor(max_workers=2) if speculative_remote else None
+        )
     
     def _max_tokens_for_difficulty(self, difficulty: float) -> int:
         """
@@ -63,6 +127,92 @@ class LLMRouter:
         else:
             return 512
     
+    def _should_retry_locally(self, current_max_tokens: int, verdict) -> bool:
+        """
+        Decide whether a failed local answer is worth regenerating locally.
+
+        Only truncation is fixable by a bigger token budget — uncertainty or
+        low relevance won't improve by regenerating with more tokens. And a
+        doubled retry re-runs the whole prompt, so once the budget reaches
+        256 tokens a local regeneration costs more latency than the remote
+        call it is trying to avoid; escalate instead when a remote model
+        is available.
+
+        Args:
+            current_max_tokens: Token budget used for the failed attempt
+            verdict: VerificationResult for the failed attempt
+
+        Returns:
+            True if a local regeneration with a doubled budget makes sense
+        """
+        if not verdict.truncated:
+            return False
+        if self.remote_llm is not None and current_max_tokens >= 256:
+            return False
+        return True
+
+    def _generate_verified(self, query: str, start_max_tokens: int,
+                           difficulty: float):
+        """
+        Generate locally with verification and bounded regeneration.
+
+        Runs the shared verify-and-regenerate loop used by both the easy and
+        medium routing branches: generate, verify, and regenerate with a
+        doubled token budget while _should_retry_locally says it can help,
+        up to max_retries attempts. Sets result["verification"] to "passed"
+        or the joined failure reasons.
+
+        Args:
+            query: The input query/prompt string
+            start_max_tokens: Token budget for the first attempt
+            difficulty: Query difficulty score (for relevance gating)
+
+        Returns:
+            Tuple of (result, verdict, retry_count) for the final attempt
+        """
+        retry_count = 0
+        current_max_tokens = start_max_tokens
+
+        for _ in range(self.max_retries + 1):
+            result = self.local_llm.generate(query, max_tokens=current_max_tokens)
+
+            # Verify the response
+            verdict = self.verifier.verify(
+                answer=result["text"],
+                output_tokens=result["output_tokens"],
+                max_tokens=current_max_tokens,
+                query=query,  # For relevance checking
+                difficulty=difficulty  # For relevance gating
+            )
+
+            if verdict.passed:
+                result[_K_VERIFICATION] = "passed"
+                break
+
+            # Regenerate with a pre-sized budget only when that can help.
+            # The truncated attempt tells us how many tokens the answer
+            # actually needed, so size the retry from that (with headroom)
+            # rather than blind doubling — one well-sized regeneration
+            # instead of an iterative double-and-hope sequence
+            if retry_count < self.max_retries and self._should_retry_locally(
+                current_max_tokens, verdict
+            ):
+                retry_count += 1
+                current_max_tokens = min(
+                    max(
+                        current_max_tokens * 2,
+                        int(result["output_tokens"] * 1.6) + 32
+                    ),
+                    self.max_regen_tokens
+                )
+                continue
+
+            # Verification failed and no worthwhile retries left
+            result[_K_VERIFICATION] = f"failed: {', '.join(verdict.reasons)}"
+            break
+
+        return result, verdict, retry_count
+
     def route(self, query: str) -> Dict:
         """
         Routes query to appropriate LLM based on difficulty.
@@ -89,9 +239,78 @@ class LLMRouter:
                 "cost_saved": float        # Estimated cost savings (if applicable)
             }
         """
-        # 1. Estimate difficulty
-        difficulty = self.difficulty_estimator.estimate(query)
-        
+        # 0. Semantic cache: duplicate (and, with embeddings, paraphrased)
+        # queries return the cached result with zero model cost
+        if self.cache_results:
+            cached, tier = self.cache.get_with_tier(query)
+            if cached is not None:
+                result = dict(cached)
+                result["cache_hit"] = True
+                result["cache_tier"] = tier  # "exact" or "semantic"
+                return result
+
+        result = self._route_uncached(query)
+        if self.cache_results:
+            self.cache.put(query, result)
+        return result
+
+    def route_batch(self, queries: List[str]) -> List[Dict]:
+        """
+        Route a batch of queries, scoring difficulty in one vectorized pass.
+
+        Difficulty for the whole batch comes from a single
+        batch_estimate() call (NumPy array arithmetic when available)
+        instead of per-query scoring. Generation itself still runs
+        sequentially — the local model processes one prompt at a time; use
+        aroute_many() for concurrent execution. Batch-scored results omit
+        the per-component difficulty breakdown.
+
+        Args:
+            queries: List of input query/prompt strings
+
+        Returns:
+            List of result dictionaries, in the same order as queries
+        """
+        difficulties = self.difficulty_estimator.batch_estimate(queries)
+        results = []
+        for query, difficulty in zip(queries, difficulties):
+            cached = self.cache.get(query) if self.cache_results else None
+            if cached is not None:
+                result = dict(cached)
+                result["cache_hit"] = True
+            else:
+                result = self._route_uncached(
+                    query, estimate={"difficulty": difficulty, "components": None}
+                )
+                if self.cache_results:
+                    self.cache.put(query, result)
+            results.append(result)
+        return results
+
+    def _route_uncached(self, query: str, estimate: Optional[Dict] = None) -> Dict:
+        """
+        Run the full routing policy without consulting the cache.
+
+        Args:
+            query: The input query/prompt string
+            estimate: Optional precomputed difficulty estimate (as returned
+                by estimate_detailed); route_batch passes one to avoid
+                re-scoring queries already scored in the batch pass
+
+        Returns:
+            Same result dictionary as route()
+        """
+        # 1. Estimate difficulty (with component scores, so the UI can show
+        # the breakdown without re-running the scorers)
+        if estimate is None:
+            estimate = self.difficulty_estimator.estimate_detailed(query)
+        difficulty = estimate["difficulty"]
+        difficulty_components = estimate["components"]
+
+        # Round once at the reporting boundary; the threshold comparisons
+        # below use the raw float (the estimator no longer rounds)
+        difficulty_rounded = round(difficulty, 3)
+
         # 2. Determine adaptive token budget based on difficulty
         max_tokens = self._max_tokens_for_difficulty(difficulty)
         
@@ -99,137 +318,109 @@ class LLMRouter:
         LOCAL_COST = 1
         REMOTE_COST = 20
         
-        # Helper: build continuation prompt for truncated responses
-        def build_continuation_prompt(original_query: str, partial_answer: str) -> str:
-            """Build a prompt to continue a truncated answer."""
-            return (
-                f"Question:\n{original_query}\n\n"
-                f"Partial answer:\n{partial_answer}\n\n"
-                "Continue the answer. Finish the current sentence and conclude clearly in 2–3 sentences."
-            )
-        
         # 2. Easy queries → local model with adaptive tokens, verify and regenerate if needed
         if difficulty < 0.3:
-            retry_count = 0
-            current_max_tokens = max_tokens
-            
-            while True:
-                result = self.local_llm.generate(query, max_tokens=current_max_tokens)
-                
-                # Verify the response
-                verdict = self.verifier.verify(
-                    answer=result["text"],
-                    output_tokens=result["output_tokens"],
-                    max_tokens=current_max_tokens,
-                    query=query,  # For relevance checking
-                    difficulty=difficulty  # For relevance gating
-                )
-                
-                # If verification passes, return
-                if verdict.passed:
-                    result["verification"] = "passed"
-                    break
-                
-                # If truncated and we have retry budget, regenerate with more tokens
-                if verdict.truncated and retry_count < self.max_retries:
-                    retry_count += 1
-                    current_max_tokens *= 2  # Double the token budget
-                    continue
-                
-                # Verification failed and no retries left
-                result["verification"] = f"failed: {', '.join(verdict.reasons)}"
-                break
-            
-            # Estimate what remote call would cost (for cost_saved calculation)
-            estimated_remote_cost = (
-                (result["input_tokens"] / 1000) * 0.005 +
-                (result["output_tokens"] / 1000) * 0.015
+            result, verdict, retry_count = self._generate_verified(
+                query, max_tokens, difficulty
             )
+
+            # Estimate what remote call would cost (for cost_saved calculation)
+            estimated_remote_cost = _remote_cost(result)
             
             routing_decision = "repaired" if retry_count > 0 and verdict.passed else "local"
-            result.update({
-                "difficulty": difficulty,
-                "routing_decision": routing_decision,
-                "cost_usd": 0.0,  # Local model cost is effectively $0
-                "cost_saved_usd": round(estimated_remote_cost, 6),
-                "cost_saved": REMOTE_COST - LOCAL_COST  # Keep relative units too
-            })
+            result[_K_DIFFICULTY] = difficulty_rounded
+            result[_K_COMPONENTS] = difficulty_components
+            result[_K_DECISION] = routing_decision
+            result[_K_COST_USD] = 0.0  # Local model cost is effectively $0
+            result[_K_COST_SAVED_USD] = round(estimated_remote_cost, 6)
+            result[_K_COST_SAVED] = REMOTE_COST - LOCAL_COST  # Keep relative units too
             return result
         
         # 3. Medium queries → local first, verify, regenerate if needed, escalate if still fails
         if difficulty < 0.6:
-            retry_count = 0
-            current_max_tokens = max_tokens
-            
-            while True:
-                local_result = self.local_llm.generate(query, max_tokens=current_max_tokens)
-                
-                # Verify the response
-                verdict = self.verifier.verify(
-                    answer=local_result["text"],
-                    output_tokens=local_result["output_tokens"],
-                    max_tokens=current_max_tokens,
-                    query=query,  # For relevance checking
-                    difficulty=difficulty  # For relevance gating
+            # Speculative escalation: in the upper-medium band, escalation is
+            # likely, so optionally kick off the remote call while the local
+            # model generates — if we do escalate, the API round-trip has
+            # already been overlapped with local generation
+            speculative_future = None
+            if (
+                self.speculative_remote
+                and self.remote_llm is not None
+                and difficulty > 0.5
+            ):
+                speculative_future = self._executor.submit(
+                    self.remote_llm.generate, query
                 )
-                
-                # If verification passes, return local result
-                if verdict.passed:
-                    local_result["verification"] = "passed"
-                    break
-                
-                # If truncated and we have retry budget, regenerate with more tokens
-                if verdict.truncated and retry_count < self.max_retries:
-                    retry_count += 1
-                    current_max_tokens *= 2  # Double the token budget
-                    continue
-                
-                # Verification failed and no retries left
-                local_result["verification"] = f"failed: {', '.join(verdict.reasons)}"
-                break
-            
+
+            # Shared verify-and-regenerate loop; a medium query truncated at
+            # 256 tokens escalates directly instead of paying for a
+            # 512-token local regeneration (_should_retry_locally)
+            local_result, verdict, retry_count = self._generate_verified(
+                query, max_tokens, difficulty
+            )
+
             # If verification passed (after regeneration if needed), return local result
             if verdict.passed:
-                estimated_remote_cost = (
-                    (local_result["input_tokens"] / 1000) * 0.005 +
-                    (local_result["output_tokens"] / 1000) * 0.015
-                )
+                if speculative_future is not None:
+                    # Local answer won; drop the speculative call if it
+                    # hasn't started (the API was still billed if it ran)
+                    speculative_future.cancel()
+                estimated_remote_cost = _remote_cost(local_result)
                 routing_decision = "repaired" if retry_count > 0 else "local"
-                local_result.update({
-                    "difficulty": difficulty,
-                    "routing_decision": routing_decision,
-                    "cost_usd": 0.0,
-                    "cost_saved_usd": round(estimated_remote_cost, 6),
-                    "cost_saved": REMOTE_COST - LOCAL_COST
-                })
+                local_result[_K_DIFFICULTY] = difficulty_rounded
+                local_result[_K_COMPONENTS] = difficulty_components
+                local_result[_K_DECISION] = routing_decision
+                local_result[_K_COST_USD] = 0.0
+                local_result[_K_COST_SAVED_USD] = round(estimated_remote_cost, 6)
+                local_result[_K_COST_SAVED] = REMOTE_COST - LOCAL_COST
                 return local_result
             
             # If verification failed (uncertainty, low relevance, or regeneration failed), escalate
             if self.remote_llm is not None:
-                remote_result = self.remote_llm.generate(query)
-                remote_result.update({
-                    "difficulty": difficulty,
-                    "routing_decision": "escalated",
-                    "cost_saved_usd": 0.0,
-                    "cost_saved": 0,
-                    "verification": f"failed: {', '.join(verdict.reasons)}"
-                })
+                if speculative_future is not None and not speculative_future.cancelled():
+                    # Remote call already in flight — just collect it
+                    remote_result = speculative_future.result()
+                else:
+                    remote_result = self.remote_llm.generate(query)
+                remote_result[_K_DIFFICULTY] = difficulty_rounded
+                remote_result[_K_COMPONENTS] = difficulty_components
+                remote_result[_K_DECISION] = "escalated"
+                remote_result[_K_COST_SAVED_USD] = 0.0
+                remote_result[_K_COST_SAVED] = 0
+                remote_result[_K_VERIFICATION] = f"failed: {', '.join(verdict.reasons)}"
                 return remote_result
             else:
                 # No remote LLM available, return local result with warning
-                local_result.update({
-                    "difficulty": difficulty,
-                    "routing_decision": "local",
-                    "cost_usd": 0.0,
-                    "cost_saved_usd": 0.0,
-                    "cost_saved": 0
-                })
+                local_result[_K_DIFFICULTY] = difficulty_rounded
+                local_result[_K_COMPONENTS] = difficulty_components
+                local_result[_K_DECISION] = "local"
+                local_result[_K_COST_USD] = 0.0
+                local_result[_K_COST_SAVED_USD] = 0.0
+                local_result[_K_COST_SAVED] = 0
                 return local_result
         
         # 4. Hard queries → remote model directly
         if self.remote_llm is None:
             raise ValueError("Remote LLM not provided for hard queries")
-        
+
+        # Client-side cost pre-check: skip the remote round-trip entirely
+        # when the projected cost blows the per-call budget
+        if (
+            self.max_remote_cost_usd is not None
+            and hasattr(self.remote_llm, "estimate_cost")
+        ):
+            projected_cost = self.remote_llm.estimate_cost(query, max_tokens=max_tokens)
+            if projected_cost > self.max_remote_cost_usd:
+                result = self.local_llm.generate(query, max_tokens=max_tokens)
+                result[_K_DIFFICULTY] = difficulty_rounded
+                result[_K_COMPONENTS] = difficulty_components
+                result[_K_DECISION] = "local"
+                result[_K_COST_USD] = 0.0
+                result[_K_COST_SAVED_USD] = round(projected_cost, 6)
+                result[_K_COST_SAVED] = REMOTE_COST - LOCAL_COST
+                result[_K_VERIFICATION] = "skipped (remote over budget)"
+                return result
+
         remote_result = self.remote_llm.generate(query, max_tokens=max_tokens)
         # Verify remote result too (for consistency, though we trust GPT-4o more)
         verdict = self.verifier.verify(
@@ -239,12 +430,146 @@ class LLMRouter:
             query=query,  # For relevance checking
             difficulty=difficulty  # For relevance gating
         )
-        remote_result.update({
-            "difficulty": difficulty,
-            "routing_decision": "remote",
-            "cost_saved_usd": 0.0,  # No savings, we used the expensive model
-            "cost_saved": 0,
-            "verification": "passed" if verdict.passed else f"failed: {', '.join(verdict.reasons)}"
-        })
+        remote_result[_K_DIFFICULTY] = difficulty_rounded
+        remote_result[_K_COMPONENTS] = difficulty_components
+        remote_result[_K_DECISION] = "remote"
+        remote_result[_K_COST_SAVED_USD] = 0.0  # No savings, we used the expensive model
+        remote_result[_K_COST_SAVED] = 0
+        remote_result[_K_VERIFICATION] = "passed" if verdict.passed else f"failed: {', '.join(verdict.reasons)}"
+        return remote_result
+
+    def stream_route(self, query: str):
+        """
+        Route a query and stream the response as text fragments.
+
+        Applies the same difficulty-based model selection as route(), but
+        yields tokens as they are generated instead of returning a result
+        dict. Verification and regeneration don't apply in stream mode —
+        the caller sees tokens before the full answer exists.
+
+        Args:
+            query: The input query/prompt string
+
+        Yields:
+            Text fragments as they are generated
+        """
+        difficulty = self.difficulty_estimator.estimate(query)
+        max_tokens = self._max_tokens_for_difficulty(difficulty)
+
+        if (
+            difficulty >= 0.6
+            and self.remote_llm is not None
+            and hasattr(self.remote_llm, "stream_generate")
+        ):
+            yield from self.remote_llm.stream_generate(query, max_tokens=max_tokens)
+        elif hasattr(self.local_llm, "stream_generate"):
+            yield from self.local_llm.stream_generate(query, max_tokens=max_tokens)
+        else:
+            # Backend without streaming support: fall back to a blocking
+            # call and yield the full text once
+            yield self.local_llm.generate(query, max_tokens=max_tokens)["text"]
+
+    async def aroute(self, query: str) -> Dict:
+        """
+        Async counterpart of route().
+
+        Hard queries go straight to the remote model via its async client
+        when available, with the same semantic cache and per-call budget
+        policy as route(); verification runs through verify_async so its
+        embedding round-trips overlap with other awaited work instead of
+        serializing a gather fan-out. Local paths (easy/medium) run the
+        synchronous route() in a worker thread, since llama.cpp generation
+        is CPU/GPU-bound anyway.
+
+        Args:
+            query: The input query/prompt string
+
+        Returns:
+            Same result dictionary as route()
+        """
+        estimate = self.difficulty_estimator.estimate_detailed(query)
+        difficulty = estimate["difficulty"]
+
+        # Easy/medium queries (or no async remote): run the sync path
+        # off-loop; route() applies the cache there
+        if difficulty < 0.6 or not hasattr(self.remote_llm, "agenerate"):
+            return await asyncio.to_thread(self.route, query)
+
+        difficulty_components = estimate["components"]
+        difficulty_rounded = round(difficulty, 3)
+        max_tokens = self._max_tokens_for_difficulty(difficulty)
+
+        # Same cache policy as route(): duplicate (and paraphrased)
+        # queries return the cached result with zero model cost
+        if self.cache_results:
+            cached, tier = self.cache.get_with_tier(query)
+            if cached is not None:
+                result = dict(cached)
+                result["cache_hit"] = True
+                result["cache_tier"] = tier
+                return result
+
+        LOCAL_COST = 1
+        REMOTE_COST = 20
+
+        # Same client-side budget pre-check as the sync hard path: skip
+        # the remote round-trip when the projected cost blows the cap
+        if (
+            self.max_remote_cost_usd is not None
+            and hasattr(self.remote_llm, "estimate_cost")
+        ):
+            projected_cost = self.remote_llm.estimate_cost(query, max_tokens=max_tokens)
+            if projected_cost > self.max_remote_cost_usd:
+                result = await asyncio.to_thread(
+                    self.local_llm.generate, query, max_tokens=max_tokens
+                )
+                result[_K_DIFFICULTY] = difficulty_rounded
+                result[_K_COMPONENTS] = difficulty_components
+                result[_K_DECISION] = "local"
+                result[_K_COST_USD] = 0.0
+                result[_K_COST_SAVED_USD] = round(projected_cost, 6)
+                result[_K_COST_SAVED] = REMOTE_COST - LOCAL_COST
+                result[_K_VERIFICATION] = "skipped (remote over budget)"
+                if self.cache_results:
+                    self.cache.put(query, result)
+                return result
+
+        remote_result = await self.remote_llm.agenerate(query, max_tokens=max_tokens)
+        verdict = await self.verifier.verify_async(
+            answer=remote_result["text"],
+            output_tokens=remote_result["output_tokens"],
+            max_tokens=max_tokens,
+            query=query,
+            difficulty=difficulty
+        )
+        remote_result[_K_DIFFICULTY] = difficulty_rounded
+        remote_result[_K_COMPONENTS] = difficulty_components
+        remote_result[_K_DECISION] = "remote"
+        remote_result[_K_COST_SAVED_USD] = 0.0
+        remote_result[_K_COST_SAVED] = 0
+        remote_result[_K_VERIFICATION] = "passed" if verdict.passed else f"failed: {', '.join(verdict.reasons)}"
+        if self.cache_results:
+            self.cache.put(query, remote_result)
         return remote_result
 
+    async def aroute_many(self, queries: List[str]) -> List[Dict]:
+        """
+        Route a batch of queries concurrently with asyncio.gather.
+
+        Concurrency is bounded by a semaphore (self.max_concurrency) so large
+        batches don't blow through API rate limits.
+
+        Args:
+            queries: List of input query/prompt strings
+
+        Returns:
+            List of result dictionaries, in the same order as queries
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def bounded_route(query: str) -> Dict:
+            async with semaphore:
+                return await self.aroute(query)
+
+        return await asyncio.gather(*[bounded_route(q) for q in queries])
+
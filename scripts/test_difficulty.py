@@ -51,11 +51,17 @@ def main():
     hard_count = 0
     
     for i, (query, description) in enumerate(test_queries, 1):
-        score = estimator.estimate(query)
-        length = estimator._length_score(query)
-        keyword = estimator._keyword_score(query)
-        structure = estimator._structure_score(query)
-        
+        # One estimator pass per query: estimate_detailed shares the
+        # lowercasing/tokenization across all three sub-scores instead of
+        # re-running each scorer for the breakdown
+        detailed = estimator.estimate_detailed(query)
+        score = detailed["difficulty"]
+        components = detailed["components"]
+        length = components["length"]
+        keyword = components["keyword"]
+        structure = components["structure"]
+
+
         # Categorize
         if score < 0.3:
             category = "🟢 Easy"
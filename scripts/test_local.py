@@ -9,6 +9,7 @@ IMPORTANT: Make sure to activate your virtual environment first:
     python3 test_local.py
 """
 
+import os
 import sys
 from pathlib import Path
 
@@ -20,8 +21,9 @@ from llm.local import LocalLLM
 
 def main():
     """Run sanity test for LocalLLM."""
-    # Use GGUF model path
-    model_path = Path(__file__).parent.parent / "models" / "phi-2.Q4_K_M.gguf"
+    # Use GGUF model path (override with LOCAL_GGUF to benchmark other quants)
+    default_model = Path(__file__).parent.parent / "models" / "phi-2.Q4_K_M.gguf"
+    model_path = Path(os.getenv("LOCAL_GGUF", str(default_model)))
     
     if not model_path.exists():
         print(f"ERROR: Model not found at {model_path}")
@@ -2,7 +2,7 @@
 Utility functions for the LLM Router project.
 """
 
-from .metrics import MetricsLogger
+from .metrics import MetricsLogger, AsyncMetricsLogger, RoutingResult
 
-__all__ = ["MetricsLogger"]
+__all__ = ["MetricsLogger", "AsyncMetricsLogger", "RoutingResult"]
 
@@ -4,11 +4,154 @@ Metrics logging utilities.
 Provides CSV logging for routing decisions, costs, and performance metrics.
 """
 
+import atexit
 import csv
+import functools
 import json
+import os
+import queue
+import struct
+import threading
+import time
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Union
+
+try:
+    # Rust JSON serializer: ~5x faster than stdlib json on large exports
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    # Binary msgpack serializer (orjson's sibling): numeric-heavy records
+    # shrink to roughly half their JSON text size
+    import ormsgpack
+    ORMSGPACK_AVAILABLE = True
+except ImportError:
+    ORMSGPACK_AVAILABLE = False
+
+
+# Fixed CSV row shape: formatting one template string is far cheaper than
+# csv.writer walking a list and type-checking every element per row
+_CSV_ROW_FMT = (
+    "{ts},{q},{diff:.4f},{dec},{mdl},{it},{ot},{tt},"
+    "{lat:.2f},{cost:.6f},{saved:.6f},{dev}\n"
+)
+
+
+def _escape_csv(value: str) -> str:
+    """
+    Quote a CSV field only when it needs it.
+
+    routing_decision/model/device never contain delimiters, and most
+    queries don't either, so the common case returns the string untouched.
+    """
+    if '"' in value or "," in value or "\n" in value or "\r" in value:
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+@functools.lru_cache(maxsize=1024)
+def _prep_query(query: str) -> str:
+    """
+    Truncated, CSV-escaped form of a query, memoized.
+
+    Retries and repeated prompts log the same query many times; a cache
+    hit replaces the slice allocation and escape scan with a dict lookup.
+    """
+    return _escape_csv(query[:200])
+
+
+# Timestamp memo: [epoch second, isoformat prefix for that second]
+_TS_CACHE = [0, ""]
+
+
+def _iso_timestamp() -> str:
+    """
+    Current time in isoformat, cheaper than datetime.now().isoformat().
+
+    Records land many per second, but the date-through-seconds prefix only
+    changes once a second — so it is cached and each call pays one
+    time.time_ns() plus an f-string for the microseconds. Output matches
+    datetime.now().isoformat() exactly. A race on the cache is benign: both
+    threads would write the same prefix.
+    """
+    ns = time.time_ns()
+    sec = ns // 1_000_000_000
+    if sec != _TS_CACHE[0]:
+        _TS_CACHE[1] = datetime.fromtimestamp(sec).isoformat()
+        _TS_CACHE[0] = sec
+    return f"{_TS_CACHE[1]}.{(ns % 1_000_000_000) // 1000:06d}"
+
+
+# Hand-rolled __slots__ class rather than dataclass(slots=True), which
+# needs Python 3.10 (setup.py supports 3.9): fixed attribute layout, so
+# the logger reads fields directly instead of paying a dict .get()
+# dispatch per column per record
+class RoutingResult:
+    """
+    Fixed-layout routing record for metrics logging.
+
+    Routing code can construct these directly; dict results from
+    router.route() are converted once at the log() boundary via from_dict.
+
+    Attributes mirror the CSV columns (timestamp and query are supplied
+    separately by the logger).
+    """
+
+    __slots__ = (
+        "difficulty",
+        "routing_decision",
+        "model",
+        "input_tokens",
+        "output_tokens",
+        "latency_ms",
+        "cost_usd",
+        "cost_saved_usd",
+        "device",
+    )
+
+    def __init__(self,
+                 difficulty: float = 0.0,
+                 routing_decision: str = "unknown",
+                 model: str = "unknown",
+                 input_tokens: int = 0,
+                 output_tokens: int = 0,
+                 latency_ms: float = 0.0,
+                 cost_usd: float = 0.0,
+                 cost_saved_usd: float = 0.0,
+                 device: str = "unknown"):
+        self.difficulty = difficulty
+        self.routing_decision = routing_decision
+        self.model = model
+        self.input_tokens = input_tokens
+        self.output_tokens = output_tokens
+        self.latency_ms = latency_ms
+        self.cost_usd = cost_usd
+        self.cost_saved_usd = cost_saved_usd
+        self.device = device
+
+    def to_dict(self) -> Dict:
+        """Record fields as a plain dictionary (for the record stream)."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, result: Dict) -> "RoutingResult":
+        """Build a record from a router.route() result dictionary."""
+        return cls(
+            difficulty=result.get("difficulty", 0.0),
+            routing_decision=result.get("routing_decision", "unknown"),
+            model=result.get("model", "unknown"),
+            input_tokens=result.get("input_tokens", 0),
+            output_tokens=result.get("output_tokens", 0),
+            latency_ms=result.get("latency_ms", 0.0),
+            cost_usd=result.get("cost_usd", 0.0),
+            cost_saved_usd=result.get("cost_saved_usd", 0.0),
+            device=result.get("device", "unknown")
+        )
 
 
 class MetricsLogger:
@@ -24,12 +167,29 @@ class MetricsLogger:
     - Cost savings
     """
     
-    def __init__(self, log_dir: str = "logs"):
+    # CSV columns parsed back to numbers when export_json reconstructs
+    # records from the CSV (the enable_json=False path)
+    _CSV_NUMERIC = {
+        "difficulty": float,
+        "input_tokens": int,
+        "output_tokens": int,
+        "total_tokens": int,
+        "latency_ms": float,
+        "cost_usd": float,
+        "cost_saved_usd": float,
+    }
+
+    def __init__(self, log_dir: str = "logs", enable_json: bool = False):
         """
         Initialize metrics logger.
-        
+
         Args:
             log_dir: Directory to store log files
+            enable_json: Keep a full record stream (msgpack/JSONL) with
+                every result field for export_json. Off by default — the
+                CSV is the primary consumer, and skipping the record build
+                saves a dict plus a serialization per log() call;
+                export_json then reconstructs records from the CSV columns.
         """
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(exist_ok=True)
@@ -38,74 +198,210 @@ class MetricsLogger:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.csv_file = self.log_dir / f"routing_metrics_{timestamp}.csv"
         self.json_file = self.log_dir / f"routing_metrics_{timestamp}.json"
+        # Record stream (opt-in): length-prefixed msgpack frames when
+        # ormsgpack is installed, JSON Lines otherwise
+        record_ext = "msgpack" if ORMSGPACK_AVAILABLE else "jsonl"
+        self.record_file = (
+            self.log_dir / f"routing_metrics_{timestamp}.{record_ext}"
+            if enable_json else None
+        )
+
+        # Paths stringified once: every open()/summary read pays a plain
+        # attribute load instead of a Path __fspath__/__str__ dispatch
+        self._csv_path_str = os.fspath(self.csv_file)
+        self._json_path_str = os.fspath(self.json_file)
+        self._record_path_str = (
+            os.fspath(self.record_file) if self.record_file else None
+        )
         
-        # Initialize CSV with headers
-        self._init_csv()
-        
-        # Store all metrics for JSON export
-        self.metrics = []
-    
-    def _init_csv(self):
-        """Initialize CSV file with headers."""
-        with open(self.csv_file, 'w', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow([
-                "timestamp",
-                "query",
-                "difficulty",
-                "routing_decision",
-                "model",
-                "input_tokens",
-                "output_tokens",
-                "total_tokens",
-                "latency_ms",
-                "cost_usd",
-                "cost_saved_usd",
-                "device"
-            ])
-    
-    def log(self, result: Dict, query: str):
+        # One long-lived buffered handle: per-log() open/close is a
+        # syscall-bound pattern that dominates at thousands of rows.
+        # csv.writer is only used for the one-time header; data rows go
+        # through the _CSV_ROW_FMT template
+        self._csv_fh = open(self._csv_path_str, 'w', newline='', buffering=1 << 16)
+        csv.writer(self._csv_fh).writerow([
+            "timestamp",
+            "query",
+            "difficulty",
+            "routing_decision",
+            "model",
+            "input_tokens",
+            "output_tokens",
+            "total_tokens",
+            "latency_ms",
+            "cost_usd",
+            "cost_saved_usd",
+            "device"
+        ])
+
+        # Rows accumulate here and hit the writer in writerows batches,
+        # amortizing the per-row Python call overhead
+        self._csv_buf = []
+        self._csv_batch = 64
+
+        # Streaming record log on a raw fd: os.write skips the
+        # BufferedWriter lock, and frames are coalesced so each batch costs
+        # exactly one syscall
+        self._record_fd = (
+            os.open(
+                self._record_path_str,
+                os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+                0o644
+            )
+            if enable_json else None
+        )
+        self._record_buf = []
+
+        # The buffered tail must survive abrupt exits
+        atexit.register(self.flush)
+
+        # Running aggregates so get_summary is O(1) instead of a scan
+        # over every logged record
+        self._total_queries = 0
+        # Costs accumulate as integer micro-USD: integer adds are exact,
+        # so long runs can't drift the way repeated float sums do
+        self._total_cost_micros = 0
+        self._total_saved_micros = 0
+        self._total_latency = 0.0
+        self._total_tokens = 0
+        self._decisions = Counter()
+
+    def log(self, result: Union[Dict, RoutingResult], query: str):
         """
         Log a routing result.
-        
+
         Args:
-            result: Result dictionary from router.route()
+            result: RoutingResult record, or a result dictionary from
+                router.route() (converted once at this boundary)
             query: Original query string
         """
-        timestamp = datetime.now().isoformat()
-        
-        # Prepare CSV row
-        row = [
-            timestamp,
-            query[:200],  # Truncate long queries
-            result.get("difficulty", 0.0),
-            result.get("routing_decision", "unknown"),
-            result.get("model", "unknown"),
-            result.get("input_tokens", 0),
-            result.get("output_tokens", 0),
-            result.get("input_tokens", 0) + result.get("output_tokens", 0),
-            result.get("latency_ms", 0.0),
-            result.get("cost_usd", 0.0),
-            result.get("cost_saved_usd", 0.0),
-            result.get("device", "unknown")
-        ]
-        
-        # Write to CSV
-        with open(self.csv_file, 'a', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow(row)
-        
-        # Store for JSON export
-        self.metrics.append({
+        timestamp = _iso_timestamp()
+
+        # Dict callers pay the field lookups exactly once, here; everything
+        # below is direct slotted-attribute access
+        if isinstance(result, dict):
+            extra = result
+            result = RoutingResult.from_dict(result)
+        else:
+            extra = None
+
+        total_tokens = result.input_tokens + result.output_tokens
+
+        row = _CSV_ROW_FMT.format(
+            ts=timestamp,
+            q=_prep_query(query),  # Truncated and escaped, memoized
+            diff=result.difficulty,
+            dec=_escape_csv(result.routing_decision),
+            mdl=_escape_csv(result.model),
+            it=result.input_tokens,
+            ot=result.output_tokens,
+            tt=total_tokens,
+            lat=result.latency_ms,
+            cost=result.cost_usd,
+            saved=result.cost_saved_usd,
+            dev=_escape_csv(result.device)
+        )
+
+        # Buffer the formatted row; flushed in joined batches
+        self._csv_buf.append(row)
+        if len(self._csv_buf) >= self._csv_batch:
+            self._csv_fh.write("".join(self._csv_buf))
+            self._csv_buf.clear()
+
+        # Update running aggregates
+        self._total_queries += 1
+        self._total_cost_micros += int(round(result.cost_usd * 1_000_000))
+        self._total_saved_micros += int(round(result.cost_saved_usd * 1_000_000))
+        self._total_latency += result.latency_ms
+        self._total_tokens += total_tokens
+        self._decisions[result.routing_decision] += 1
+
+        # Stream the full record to the record log (when enabled); dict
+        # input keeps its extra keys (text, verification, cache flags)
+        if self._record_fd is None:
+            return
+        record = {
             "timestamp": timestamp,
             "query": query,
-            **result
-        })
+            **(extra if extra is not None else result.to_dict())
+        }
+        if ORMSGPACK_AVAILABLE:
+            packed = ormsgpack.packb(record)
+            frame = struct.pack("<I", len(packed)) + packed
+        elif ORJSON_AVAILABLE:
+            frame = orjson.dumps(record) + b"\n"
+        else:
+            frame = json.dumps(record).encode() + b"\n"
+        self._record_buf.append(frame)
+        if len(self._record_buf) >= self._csv_batch:
+            os.write(self._record_fd, b"".join(self._record_buf))
+            self._record_buf.clear()
     
+    def flush(self):
+        """Drain the row buffers and push everything to disk."""
+        if self._csv_fh is not None and not self._csv_fh.closed:
+            if self._csv_buf:
+                self._csv_fh.write("".join(self._csv_buf))
+                self._csv_buf.clear()
+            self._csv_fh.flush()
+        if self._record_fd is not None and self._record_buf:
+            os.write(self._record_fd, b"".join(self._record_buf))
+            self._record_buf.clear()
+
+    def close(self):
+        """Flush and close the log handles. Safe to call more than once."""
+        self.flush()
+        if self._csv_fh is not None and not self._csv_fh.closed:
+            self._csv_fh.close()
+        if self._record_fd is not None:
+            os.close(self._record_fd)
+            self._record_fd = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass  # Interpreter teardown; nothing sensible left to do
+
     def export_json(self):
-        """Export all metrics to JSON file."""
-        with open(self.json_file, 'w') as f:
-            json.dump(self.metrics, f, indent=2)
+        """
+        Export all metrics to JSON file (also flushes buffered CSV rows).
+
+        With enable_json, records are already durable in the record stream
+        and convert losslessly. Otherwise the records are reconstructed
+        from the CSV columns (extra result keys like text are not in the
+        CSV and so not in the export).
+        """
+        self.flush()
+
+        if self._record_fd is None and self._record_path_str is None:
+            with open(self._csv_path_str, newline='') as f:
+                metrics = []
+                for row in csv.DictReader(f):
+                    for field, cast in self._CSV_NUMERIC.items():
+                        row[field] = cast(row[field])
+                    metrics.append(row)
+        elif ORMSGPACK_AVAILABLE:
+            metrics = []
+            with open(self._record_path_str, 'rb') as f:
+                data = f.read()
+            offset = 0
+            while offset < len(data):
+                (length,) = struct.unpack_from("<I", data, offset)
+                offset += 4
+                metrics.append(ormsgpack.unpackb(data[offset:offset + length]))
+                offset += length
+        else:
+            loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+            with open(self._record_path_str, 'rb') as f:
+                metrics = [loads(line) for line in f if line.strip()]
+
+        if ORJSON_AVAILABLE:
+            with open(self._json_path_str, 'wb') as f:
+                f.write(orjson.dumps(metrics, option=orjson.OPT_INDENT_2))
+        else:
+            with open(self._json_path_str, 'w') as f:
+                json.dump(metrics, f, indent=2)
     
     def get_summary(self) -> Dict:
         """
@@ -114,32 +410,117 @@ class MetricsLogger:
         Returns:
             Dictionary with summary statistics
         """
-        if not self.metrics:
+        if self._total_queries == 0:
             return {}
-        
-        total_queries = len(self.metrics)
-        routing_decisions = {}
-        total_cost = 0.0
-        total_saved = 0.0
-        total_latency = 0.0
-        total_tokens = 0
-        
-        for metric in self.metrics:
-            decision = metric.get("routing_decision", "unknown")
-            routing_decisions[decision] = routing_decisions.get(decision, 0) + 1
-            total_cost += metric.get("cost_usd", 0.0)
-            total_saved += metric.get("cost_saved_usd", 0.0)
-            total_latency += metric.get("latency_ms", 0.0)
-            total_tokens += metric.get("input_tokens", 0) + metric.get("output_tokens", 0)
-        
+
+        # All aggregates are maintained incrementally in log(); this is a
+        # constant-time read regardless of how many records were logged
         return {
-            "total_queries": total_queries,
-            "routing_decisions": routing_decisions,
-            "total_cost_usd": round(total_cost, 6),
-            "total_cost_saved_usd": round(total_saved, 6),
-            "avg_latency_ms": round(total_latency / total_queries, 2) if total_queries > 0 else 0,
-            "total_tokens": total_tokens,
-            "csv_file": str(self.csv_file),
-            "json_file": str(self.json_file)
+            "total_queries": self._total_queries,
+            "routing_decisions": dict(self._decisions),
+            "total_cost_usd": self._total_cost_micros / 1_000_000,
+            "total_cost_saved_usd": self._total_saved_micros / 1_000_000,
+            "avg_latency_ms": round(self._total_latency / self._total_queries, 2),
+            "total_tokens": self._total_tokens,
+            "csv_file": self._csv_path_str,
+            "json_file": self._json_path_str
         }
 
+
+class AsyncMetricsLogger:
+    """
+    Non-blocking wrapper around MetricsLogger.
+
+    log() only enqueues the record; a daemon thread drains the queue and does
+    the actual file I/O, keeping disk latency off the request path (and off
+    the event loop during async fan-out). Records are dropped rather than
+    blocking the caller if the queue is full.
+    """
+
+    # Records drained per writer-thread wakeup; matches the CSV row batch
+    DRAIN_BATCH = 64
+
+    # Sentinel that tells the writer thread to exit
+    _STOP = object()
+
+    def __init__(self, log_dir: str = "logs", maxsize: int = 10_000,
+                 enable_json: bool = False):
+        """
+        Initialize the async logger and start the writer thread.
+
+        Args:
+            log_dir: Directory to store log files
+            maxsize: Maximum queued records before new ones are dropped
+            enable_json: Forwarded to MetricsLogger (full record stream)
+        """
+        self._logger = MetricsLogger(log_dir, enable_json=enable_json)
+        self._queue = queue.Queue(maxsize=maxsize)
+        self._thread = threading.Thread(target=self._drain, daemon=True)
+        self._thread.start()
+
+    def _drain(self):
+        """
+        Writer loop: drain records in batches and persist them.
+
+        Blocks for the first record, then opportunistically grabs whatever
+        else is queued (up to DRAIN_BATCH) so a burst of requests costs one
+        thread wakeup instead of one per record.
+        """
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.DRAIN_BATCH:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = False
+            for item in batch:
+                if item is self._STOP:
+                    stop = True
+                    continue
+                result, query = item
+                try:
+                    self._logger.log(result, query)
+                except Exception:
+                    pass  # Logging must never take down the writer thread
+            for _ in batch:
+                self._queue.task_done()
+            if stop:
+                return
+
+    def log(self, result: Union[Dict, RoutingResult], query: str):
+        """
+        Enqueue a routing result for background logging (non-blocking).
+
+        Args:
+            result: RoutingResult record or result dictionary from
+                router.route()
+            query: Original query string
+        """
+        try:
+            self._queue.put_nowait((result, query))
+        except queue.Full:
+            pass  # Drop rather than stall the request path
+
+    def flush(self):
+        """Block until all queued records have been written."""
+        self._queue.join()
+
+    def export_json(self):
+        """Flush pending records, then export all metrics to JSON file."""
+        self.flush()
+        self._logger.export_json()
+
+    def get_summary(self) -> Dict:
+        """Flush pending records, then return summary statistics."""
+        self.flush()
+        return self._logger.get_summary()
+
+    def close(self):
+        """Stop the writer thread and close the underlying log files."""
+        if self._thread.is_alive():
+            self._queue.put(self._STOP)
+            self._thread.join()
+        self._logger.close()
+